@@ -5,9 +5,35 @@ import threading
 import time
 import json
 import numpy as np
+from collections import OrderedDict
 from datetime import datetime
 from flask import Flask, request, jsonify
 
+# 64-bit text hashing for compact feedback-pattern keys
+try:
+    import xxhash
+
+    def hash64(text):
+        """64-bit hash of text using the fast xxhash C implementation"""
+        return xxhash.xxh3_64_intdigest(text.encode('utf-8'))
+
+except ImportError:
+    import hashlib
+
+    def hash64(text):
+        """64-bit hash of text (stable stdlib fallback when xxhash is unavailable)"""
+        return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'big')
+
+# Precompiled keyword alternations for the smart-fallback categories:
+# one C-level regex scan per category instead of a Python any(...) loop
+_PAYMENT_RE = re.compile(r"payment|pay|money|mpesa|card|bank")
+_DELIVERY_RE = re.compile(r"delivery|shipping|deliver|ship|track|order")
+_RETURN_RE = re.compile(r"return|refund|exchange|replace|back")
+_SELLER_RE = re.compile(r"seller|vendor|shop|store|business")
+_PRICE_RE = re.compile(r"price|cost|cheap|expensive|discount|offer")
+_GREETING_RE = re.compile(r"hello|hi|hey|good|morning|afternoon|evening")
+_ABOUT_RE = re.compile(r"what|jiji|about|platform|marketplace")
+
 # Initialize Flask app
 app = Flask(__name__)
 
@@ -23,11 +49,16 @@ class NLPEnhancedChatbot:
         
         # ML/RL components
         self.conversation_history = []
-        self.feedback_scores = {}
+        self.feedback_scores = OrderedDict()
+        self.max_feedback_patterns = 5000  # LRU bound to keep the feedback file small
+        self.feedback_flush_interval = 5  # Seconds between write-behind flushes
+        self._feedback_dirty = False
+        self._feedback_lock = threading.Lock()  # Guards feedback_scores against the flusher thread
         self.response_quality = {}
         self.learning_rate = 0.1
         self.vectorizer = None
         self.qa_vectors = None
+        self.qa_token_sets = []  # Pretokenized (question, answer) word sets for fast fallback matching
         
         # Advanced NLP components
         self.sentence_transformer = None
@@ -46,6 +77,10 @@ class NLPEnhancedChatbot:
         # Start model loading in background thread
         self.model_loading_thread = threading.Thread(target=self.initialize_model, daemon=True)
         self.model_loading_thread.start()
+
+        # Start write-behind flusher for feedback scores
+        self.feedback_flush_thread = threading.Thread(target=self.flush_feedback_loop, daemon=True)
+        self.feedback_flush_thread.start()
         
     def initialize_nlp_components(self):
         """Initialize advanced NLP components for semantic understanding"""
@@ -216,18 +251,49 @@ class NLPEnhancedChatbot:
         try:
             if os.path.exists('feedback_scores.json'):
                 with open('feedback_scores.json', 'r', encoding='utf-8') as f:
-                    self.feedback_scores = json.load(f)
+                    # JSON stores the integer hash keys as strings; convert back
+                    self.feedback_scores = OrderedDict(
+                        (int(key), score) for key, score in json.load(f).items()
+                    )
                 print(f"Loaded feedback for {len(self.feedback_scores)} response patterns")
         except Exception as e:
             print(f"Could not load feedback scores: {e}")
             
     def save_feedback_scores(self):
-        """Save feedback scores for reinforcement learning"""
+        """Save feedback scores for reinforcement learning (atomic replace).
+
+        Returns True on success so the flusher only clears its dirty flag
+        once the scores are actually on disk.
+        """
         try:
-            with open('feedback_scores.json', 'w', encoding='utf-8') as f:
-                json.dump(self.feedback_scores, f, ensure_ascii=False, indent=2)
+            # Snapshot under the lock so concurrent feedback handlers
+            # cannot mutate the dict while it is being serialized
+            with self._feedback_lock:
+                snapshot = dict(self.feedback_scores)
+            # Write to a temp file first so a crash mid-write cannot corrupt the scores
+            temp_file = 'feedback_scores.json.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False, indent=2)
+            os.replace(temp_file, 'feedback_scores.json')
+            return True
         except Exception as e:
             print(f"Could not save feedback scores: {e}")
+            return False
+
+    def flush_feedback_loop(self):
+        """Background write-behind flusher for feedback scores.
+
+        Feedback events only mark the scores dirty; this loop coalesces
+        bursts of feedback into at most one disk write per interval.
+        """
+        while True:
+            time.sleep(self.feedback_flush_interval)
+            if self._feedback_dirty:
+                self._feedback_dirty = False
+                if not self.save_feedback_scores():
+                    # Save failed: keep the pending scores marked so the
+                    # next interval retries instead of dropping them
+                    self._feedback_dirty = True
     
     def load_qa_data(self, file_path):
         """Load questions and answers from CSV file and create ML vectors"""
@@ -257,10 +323,26 @@ class NLPEnhancedChatbot:
             
             # Create TF-IDF vectors for ML-enhanced matching
             self.create_qa_vectors()
+
+            # Pre-tokenize pairs for the keyword-matching fallback
+            self.build_token_cache()
             
         except Exception as e:
             print(f"Error loading Q&A data: {e}")
             
+    def build_token_cache(self):
+        """Pre-tokenize all Q&A pairs for the keyword-overlap fallback.
+
+        The basic matcher used to re-run regex tokenization over the whole
+        corpus on every query; caching the word sets once turns each query
+        into a set-intersection-only loop.
+        """
+        self.qa_token_sets = [
+            (set(re.findall(r'\w+', qa['question'].lower())),
+             set(re.findall(r'\w+', qa['answer'].lower())))
+            for qa in self.qa_pairs
+        ]
+
     def create_qa_vectors(self):
         """Create TF-IDF vectors for all Q&A pairs for semantic matching"""
         try:
@@ -591,7 +673,7 @@ class NLPEnhancedChatbot:
                 best_match = self.qa_pairs[best_indices[0]]
                 
                 # Apply reinforcement learning adjustment
-                pattern_key = f"{user_input.lower()[:50]}||{best_match['answer'][:50]}"
+                pattern_key = self.feedback_key(user_input, best_match['answer'])
                 feedback_multiplier = self.feedback_scores.get(pattern_key, 1.0)
                 adjusted_score = best_scores[0] * feedback_multiplier
                 
@@ -623,30 +705,26 @@ class NLPEnhancedChatbot:
         if not self.qa_pairs:
             return None
             
-        user_input_lower = user_input.lower()
-        
+        # Tokenize the user input once; Q&A tokens come from the cache
+        user_words = set(re.findall(r'\w+', user_input.lower()))
+
+        if len(self.qa_token_sets) != len(self.qa_pairs):
+            self.build_token_cache()
+
         # Simple keyword matching for context-based answers
         best_match = None
         best_score = 0
-        
-        for qa in self.qa_pairs:
-            question_lower = qa["question"].lower()
-            answer_lower = qa["answer"].lower()
-            
-            # Check for keyword overlap
-            user_words = set(re.findall(r'\w+', user_input_lower))
-            question_words = set(re.findall(r'\w+', question_lower))
-            answer_words = set(re.findall(r'\w+', answer_lower))
-            
-            # Calculate relevance score
+
+        for qa, (question_words, answer_words) in zip(self.qa_pairs, self.qa_token_sets):
+            # Calculate relevance score from keyword overlap
             question_overlap = len(user_words.intersection(question_words))
             answer_overlap = len(user_words.intersection(answer_words))
             total_score = question_overlap * 2 + answer_overlap  # Weight question matches more
-            
+
             if total_score > best_score and total_score > 1:
                 best_score = total_score
                 best_match = qa
-                
+
         if best_match:
             confidence = min(best_score / 10.0, 1.0)  # Normalize to 0-1
             return {
@@ -718,19 +796,35 @@ class NLPEnhancedChatbot:
         if len(self.conversation_history) % 10 == 0:
             self.save_conversation_history()
             
+    def feedback_key(self, user_input, response):
+        """Build a compact 64-bit hash key for a (user input, response) pattern.
+
+        Replaces the old truncated 100-char string keys: far smaller in
+        memory and no collisions from 50-char truncation of long texts.
+        """
+        return hash64(user_input.lower()) ^ ((hash64(response) << 1) & 0xFFFFFFFFFFFFFFFF)
+
     def apply_user_feedback(self, user_input, response, feedback_score):
         """Apply user feedback for reinforcement learning"""
-        pattern_key = f"{user_input.lower()[:50]}||{response[:50]}"
-        
-        # Update feedback score using exponential moving average
-        current_score = self.feedback_scores.get(pattern_key, 1.0)
-        new_score = current_score * (1 - self.learning_rate) + feedback_score * self.learning_rate
-        
-        self.feedback_scores[pattern_key] = new_score
-        
-        # Save feedback scores
-        self.save_feedback_scores()
-        
+        pattern_key = self.feedback_key(user_input, response)
+
+        # Update and evict under the lock: Flask serves requests on
+        # multiple threads, and the flusher snapshots this dict
+        with self._feedback_lock:
+            # Update feedback score using exponential moving average
+            current_score = self.feedback_scores.get(pattern_key, 1.0)
+            new_score = current_score * (1 - self.learning_rate) + feedback_score * self.learning_rate
+
+            self.feedback_scores[pattern_key] = new_score
+            self.feedback_scores.move_to_end(pattern_key)
+
+            # Evict least-recently-updated patterns to bound memory and file size
+            while len(self.feedback_scores) > self.max_feedback_patterns:
+                self.feedback_scores.popitem(last=False)
+
+        # Mark dirty; the background flusher coalesces writes to disk
+        self._feedback_dirty = True
+
         print(f"Applied feedback: {feedback_score} -> Pattern score: {new_score:.3f}")
         
     def learn_from_patterns(self):
@@ -799,8 +893,9 @@ class NLPEnhancedChatbot:
             
             if new_qa_count > 0:
                 print(f"Learned {new_qa_count} new Q&A patterns")
-                # Recreate vectors with new Q&A pairs
+                # Recreate vectors and token cache with new Q&A pairs
                 self.create_qa_vectors()
+                self.build_token_cache()
                 
         except Exception as e:
             print(f"Error updating Q&A from patterns: {e}")
@@ -830,30 +925,26 @@ class NLPEnhancedChatbot:
         if not self.qa_pairs:
             return None
             
-        user_input_lower = user_input.lower()
-        
+        # Tokenize the user input once; Q&A tokens come from the cache
+        user_words = set(re.findall(r'\w+', user_input.lower()))
+
+        if len(self.qa_token_sets) != len(self.qa_pairs):
+            self.build_token_cache()
+
         # Simple keyword matching for context-based answers
         best_match = None
         best_score = 0
-        
-        for qa in self.qa_pairs:
-            question_lower = qa["question"].lower()
-            answer_lower = qa["answer"].lower()
-            
-            # Check for keyword overlap
-            user_words = set(re.findall(r'\w+', user_input_lower))
-            question_words = set(re.findall(r'\w+', question_lower))
-            answer_words = set(re.findall(r'\w+', answer_lower))
-            
-            # Calculate relevance score
+
+        for qa, (question_words, answer_words) in zip(self.qa_pairs, self.qa_token_sets):
+            # Calculate relevance score from keyword overlap
             question_overlap = len(user_words.intersection(question_words))
             answer_overlap = len(user_words.intersection(answer_words))
             total_score = question_overlap * 2 + answer_overlap  # Weight question matches more
-            
+
             if total_score > best_score and total_score >= 2:  # At least 2 points
                 best_score = total_score
                 best_match = qa["answer"]
-        
+
         return best_match
     
     def generate_response_with_dialogpt(self, user_input):
@@ -918,12 +1009,14 @@ class NLPEnhancedChatbot:
             
             # Try to generate response using DialoGPT if available
             if self.model and self.tokenizer:
-                ai_response = self.generate_response_with_dialogpt(user_input)
-                if ai_response and len(ai_response.strip()) > 0:
+                # Strip and lowercase once; avoid rebuilding strings on the hot path
+                ai_response = (self.generate_response_with_dialogpt(user_input) or "").strip()
+                if ai_response:
                     # Add marketplace context to responses
-                    if len(ai_response) < 20 or any(word in ai_response.lower() for word in ["i don't", "not sure", "unclear"]):
+                    ai_response_lower = ai_response.lower()
+                    if len(ai_response) < 20 or any(word in ai_response_lower for word in ["i don't", "not sure", "unclear"]):
                         ai_response = f"As a Jiji marketplace assistant, {ai_response}. I can help you with questions about buying, selling, payments, delivery, and marketplace policies."
-                    
+
                     return {
                         "response": ai_response,
                         "confidence": 0.7,
@@ -951,31 +1044,31 @@ class NLPEnhancedChatbot:
         user_input_lower = user_input.lower()
         
         # Payment related keywords
-        if any(word in user_input_lower for word in ["payment", "pay", "money", "mpesa", "card", "bank"]):
+        if _PAYMENT_RE.search(user_input_lower):
             return "We accept various payment methods including M-Pesa, credit/debit cards, bank transfers, and cash on delivery. For specific payment options, please check our payment page."
-        
+
         # Delivery related keywords
-        elif any(word in user_input_lower for word in ["delivery", "shipping", "deliver", "ship", "track", "order"]):
+        elif _DELIVERY_RE.search(user_input_lower):
             return "Delivery typically takes 1-3 business days within Nairobi and 3-7 days for other locations. You can track your order using the tracking number sent via SMS."
-        
+
         # Return/refund related keywords
-        elif any(word in user_input_lower for word in ["return", "refund", "exchange", "replace", "back"]):
+        elif _RETURN_RE.search(user_input_lower):
             return "We offer a 7-day return policy for most items. Items must be in original condition. Returns are processed within 5-7 business days."
-        
+
         # Seller related keywords
-        elif any(word in user_input_lower for word in ["seller", "vendor", "shop", "store", "business"]):
+        elif _SELLER_RE.search(user_input_lower):
             return "All our sellers are verified through our comprehensive verification process. You can view seller ratings and reviews before making a purchase."
-        
+
         # Price related keywords
-        elif any(word in user_input_lower for word in ["price", "cost", "cheap", "expensive", "discount", "offer"]):
+        elif _PRICE_RE.search(user_input_lower):
             return "Prices on Jiji are competitive and set by individual sellers. You can negotiate prices directly with sellers and look for special offers and discounts."
-        
+
         # General greeting
-        elif any(word in user_input_lower for word in ["hello", "hi", "hey", "good", "morning", "afternoon", "evening"]):
+        elif _GREETING_RE.search(user_input_lower):
             return "Hello! Welcome to Jiji, East Africa's largest marketplace. I'm here to help you with questions about buying, selling, payments, delivery, and more. How can I assist you today?"
-        
+
         # Question about what is Jiji
-        elif any(word in user_input_lower for word in ["what", "jiji", "about", "platform", "marketplace"]):
+        elif _ABOUT_RE.search(user_input_lower):
             return "Jiji is East Africa's largest online marketplace where you can buy and sell almost anything - from cars and phones to houses and jobs. We connect millions of buyers and sellers across Kenya, Uganda, Tanzania, and Ghana."
         
         # Default fallback
@@ -1038,7 +1131,7 @@ def health_check():
     else:
         model_status = chatbot.model_type
     
-    return jsonify({
+    response = jsonify({
         "status": "healthy",
         "qa_pairs_loaded": len(chatbot.qa_pairs),
         "model_type": model_status,
@@ -1046,6 +1139,14 @@ def health_check():
         "context_available": len(chatbot.context_data) > 0
     })
 
+    # Health pollers hit this endpoint every few seconds; an ETag lets a
+    # client send If-None-Match and get an empty 304 while nothing changes
+    etag = f'"{hash64(response.get_data(as_text=True)):x}"'
+    if request.headers.get('If-None-Match') == etag:
+        return '', 304, {'ETag': etag}
+    response.headers['ETag'] = etag
+    return response
+
 @app.route('/stats', methods=['GET'])
 def get_stats():
     model_info = "unknown"
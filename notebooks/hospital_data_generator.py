@@ -14,38 +14,167 @@ Author: AI Term Project G3
 """
 
 import csv
+import hashlib
 import json
 import os
-import random
-from datetime import datetime, timedelta
+import shutil
+import sys
+from datetime import datetime
+from itertools import product
+from types import MappingProxyType
+
+# Optional Parquet output: pyarrow is not a project requirement, so the
+# generator degrades gracefully to CSV/JSON only when it is missing
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# Optional fast JSON: orjson encodes the whole dataset in one C call,
+# falling back to the stdlib encoder when it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Template tables for the hospital x item Q&A generators. Each record is
+# (question_template, answer_template, category); templates reference
+# {hn} (hospital name), {phone} (main phone), {item}, {item_l}
+# (lowercased item) and {item_t} (title-cased item). Formatting rows from
+# shared tables avoids rebuilding thousands of near-identical dict
+# literals in per-method loops.
+CONDITION_TEMPLATES = (
+    ('Does {hn} treat {item_l}?',
+     'Yes, {hn} has specialists and facilities to diagnose and treat {item}. Our medical team provides comprehensive care with modern equipment and evidence-based treatments.',
+     'medical_conditions'),
+    ('What specialists treat {item_l} at {hn}?',
+     'At {hn}, {item} is treated by our qualified specialists in the relevant department. We have experienced doctors with specialized training in managing {item_l}.',
+     'medical_specialists'),
+)
+
+PROCEDURE_TEMPLATES = (
+    ('Does {hn} offer {item_l}?',
+     'Yes, {hn} provides {item} services with modern equipment and qualified technicians. Please call {phone} to schedule an appointment.',
+     'procedures'),
+    ('How do I prepare for {item_l} at {hn}?',
+     'Preparation instructions for {item} will be provided when you schedule your appointment at {hn}. Our staff will guide you through any specific requirements.',
+     'procedure_preparation'),
+    ('How long does {item_l} take at {hn}?',
+     'The duration of {item} varies depending on individual cases. Our medical team at {hn} will provide you with specific timing information during consultation.',
+     'procedure_duration'),
+)
+
+DOCTOR_TEMPLATES = (
+    ('Who are the {item_l} doctors at {hn}?',
+     '{hn} has qualified {item_l} specialists with extensive training and experience. Our doctors are board-certified and provide expert medical care.',
+     'doctor_profiles'),
+    ('How do I book with a {item_l} specialist at {hn}?',
+     'To book with a {item_l} specialist at {hn}, call {phone} or visit the hospital. Referrals may be required for some specialties.',
+     'specialist_booking'),
+    ('What qualifications do {item_l} doctors have at {hn}?',
+     'Our {item_l} doctors at {hn} have medical degrees, specialized training, and are registered with the Kenya Medical Practitioners and Dentists Council.',
+     'doctor_qualifications'),
+)
+
+SCREENING_TEMPLATES = (
+    ('Does {hn} offer {item_l}?',
+     'Yes, {hn} provides {item_l} services as part of our preventive care program. Early detection is key to better health outcomes.',
+     'health_screening'),
+    ('How often should I get {item_l} at {hn}?',
+     'The frequency of {item_l} depends on your age, risk factors, and medical history. Consult with our doctors at {hn} for personalized recommendations.',
+     'screening_frequency'),
+)
+
+LAB_TEST_TEMPLATES = (
+    ('Does {hn} do {item_l}?',
+     'Yes, {hn} laboratory provides {item_l} with accurate results and quick turnaround times using modern equipment.',
+     'laboratory_tests'),
+    ('How long do {item_l} results take at {hn}?',
+     '{item_t} results at {hn} are typically available within 24-48 hours. Urgent tests may be processed faster when needed.',
+     'lab_results_time'),
+)
+
+IMAGING_TEMPLATES = (
+    ('Does {hn} have {item_l} services?',
+     'Yes, {hn} radiology department provides {item_l} services with state-of-the-art equipment and qualified radiologists.',
+     'radiology'),
+    ('How do I schedule {item_l} at {hn}?',
+     'To schedule {item_l} at {hn}, you need a doctor\'s referral. Call {phone} or visit the radiology department.',
+     'imaging_scheduling'),
+)
+
+SURGERY_TEMPLATES = (
+    ('Does {hn} perform {item_l}?',
+     'Yes, {hn} has qualified surgeons and modern operating theaters for {item_l} with comprehensive pre and post-operative care.',
+     'surgical_services'),
+    ('What should I expect before {item_l} at {hn}?',
+     'Before {item_l} at {hn}, you\'ll have pre-operative consultations, tests, and receive detailed instructions about preparation and recovery.',
+     'pre_surgery'),
+)
+
+SYMPTOM_TEMPLATES = (
+    ('I have {item}, should I go to {hn}?',
+     'If you\'re experiencing {item}, especially if severe or persistent, you should seek medical attention at {hn}. Call {phone} for guidance.',
+     'symptom_assessment'),
+    ('What causes {item}?',
+     '{item_t} can have various causes. The medical professionals at {hn} can properly evaluate your symptoms and determine the underlying cause.',
+     'symptom_causes'),
+    ('How is {item} treated at {hn}?',
+     'Treatment for {item} at {hn} depends on the underlying cause. Our doctors will conduct proper evaluation and recommend appropriate treatment.',
+     'symptom_treatment'),
+)
+
+COST_SERVICE_TEMPLATES = (
+    ('How much does {item} cost at {hn}?',
+     'The cost of {item} at {hn} varies depending on the specific treatment needed. Contact {phone} for detailed pricing information.',
+     'service_costs'),
+    ('Does insurance cover {item} at {hn}?',
+     'Insurance coverage for {item} at {hn} depends on your specific insurance plan. Check with your insurance provider and our billing department.',
+     'insurance_coverage'),
+    ('Can I pay in installments for {item} at {hn}?',
+     '{hn} may offer payment plans for {item}. Speak with our billing department about available payment options and financial assistance.',
+     'payment_plans'),
+)
+
+# Verified hospital reference data, shared read-only by every generator
+# instance (MappingProxyType blocks accidental mutation; the inner dicts
+# keep their shape so info['name']-style call sites are unchanged)
+HOSPITALS = MappingProxyType({
+    'nairobi_hospital': {
+        'name': 'Nairobi Hospital',
+        'phone_main': '+254-20-2845000',
+        'phone_emergency': '+254-20-2845000',
+        'location': 'Argwings Kodhek Road, Hurlingham, Nairobi',
+        'website': 'www.nairobihospital.org',
+        'type': 'Private Hospital',
+        'postal_address': 'P.O. Box 30026-00100',
+        'email': 'info@nairobihospital.org'
+    },
+    'kenyatta_national': {
+        'name': 'Kenyatta National Hospital',
+        'phone_main': '+254-20-2726300',
+        'phone_emergency': '+254-20-2726300',
+        'location': 'Hospital Road, Upper Hill, Nairobi',
+        'website': 'www.knh.or.ke',
+        'type': 'Public Hospital',
+        'postal_address': 'P.O. Box 20723-00202',
+        'email': 'info@knh.or.ke'
+    }
+})
 
 class HospitalDataGenerator:
     def __init__(self):
-        self.hospitals = {
-            'nairobi_hospital': {
-                'name': 'Nairobi Hospital',
-                'phone_main': '+254-20-2845000',
-                'phone_emergency': '+254-20-2845000',
-                'location': 'Argwings Kodhek Road, Hurlingham, Nairobi',
-                'website': 'www.nairobihospital.org',
-                'type': 'Private Hospital',
-                'postal_address': 'P.O. Box 30026-00100',
-                'email': 'info@nairobihospital.org'
-            },
-            'kenyatta_national': {
-                'name': 'Kenyatta National Hospital', 
-                'phone_main': '+254-20-2726300',
-                'phone_emergency': '+254-20-2726300',
-                'location': 'Hospital Road, Upper Hill, Nairobi',
-                'website': 'www.knh.or.ke',
-                'type': 'Public Hospital',
-                'postal_address': 'P.O. Box 20723-00202',
-                'email': 'info@knh.or.ke'
-            }
-        }
-        
-        # Expanded medical specialties and departments
-        self.departments = [
+        self.hospitals = HOSPITALS
+        # Snapshot of the (key, info) pairs: every generator's outer loop
+        # walks this tuple instead of building a fresh dict view each call
+        self.hospital_items = tuple(HOSPITALS.items())
+
+        # Expanded medical specialties and departments (tuples: these are
+        # fixed reference data, never mutated after construction)
+        self.departments = (
             'Cardiology', 'Neurology', 'Oncology', 'Pediatrics', 'Orthopedics',
             'Radiology', 'Emergency Medicine', 'Maternity', 'Surgery',
             'Internal Medicine', 'Psychiatry', 'Dermatology', 'Ophthalmology',
@@ -55,60 +184,149 @@ class HospitalDataGenerator:
             'Dental Services', 'Pharmacy', 'Laboratory', 'Physiotherapy',
             'Occupational Therapy', 'Speech Therapy', 'Critical Care',
             'Neonatal ICU', 'Cardiac Surgery', 'Neurosurgery', 'Plastic Surgery'
-        ]
-        
+        )
+
+        # Shorter display list used for the department information Q&A
+        # (kept separate from self.departments, which drives the full
+        # doctor-specialties Cartesian product)
+        self.core_departments = (
+            'Cardiology', 'Neurology', 'Oncology', 'Pediatrics', 'Orthopedics',
+            'Radiology', 'Emergency Medicine', 'Maternity', 'Surgery',
+            'Internal Medicine', 'Psychiatry', 'Dermatology', 'Ophthalmology',
+            'ENT', 'Gynecology', 'Urology', 'Nephrology', 'Endocrinology'
+        )
+        self.core_departments_joined = ", ".join(self.core_departments)
+        self.departments_overview_answer = (
+            f'Major departments include: {self.core_departments_joined}. '
+            'Both hospitals have qualified specialists and modern equipment.'
+        )
+
         # Medical conditions and treatments
-        self.conditions = [
+        self.conditions = (
             'Diabetes', 'Hypertension', 'Heart Disease', 'Cancer', 'Stroke',
             'Kidney Disease', 'Liver Disease', 'Asthma', 'COPD', 'Pneumonia',
             'Malaria', 'Tuberculosis', 'HIV/AIDS', 'Hepatitis', 'Typhoid',
             'Dengue Fever', 'Meningitis', 'Appendicitis', 'Gallstones',
             'Arthritis', 'Osteoporosis', 'Fractures', 'Burns', 'Wounds'
-        ]
-        
+        )
+
         # Medical procedures and tests
-        self.procedures = [
+        self.procedures = (
             'CT Scan', 'MRI', 'X-Ray', 'Ultrasound', 'ECG', 'Echocardiogram',
             'Blood Test', 'Urine Test', 'Biopsy', 'Endoscopy', 'Colonoscopy',
             'Surgery', 'Chemotherapy', 'Radiotherapy', 'Dialysis',
             'Physical Therapy', 'Vaccination', 'Health Screening'
-        ]
-        
-        self.comprehensive_data = []
-    
+        )
+
+        self._specialized_templates = {}
+        self._dataset_memo = None
+        self._categories = set()
+
+        # Combined contact blurbs reused by the multi-hospital answers,
+        # derived from the reference data so a phone-number change there
+        # propagates instead of leaving stale literals behind
+        nairobi_phone = self.hospitals['nairobi_hospital']['phone_main']
+        kenyatta_phone = self.hospitals['kenyatta_national']['phone_main']
+        self.both_contacts = f'Nairobi Hospital: {nairobi_phone}, Kenyatta: {kenyatta_phone}'
+        self.both_contacts_full = f'Nairobi Hospital: {nairobi_phone}, Kenyatta National: {kenyatta_phone}'
+
+        # Per-hospital contact answer reused across the phrasing variants,
+        # formatted once here instead of once per variant row
+        self.contact_answers = {
+            hospital_key: f'You can reach {info["name"]} at {info["phone_main"]}. '
+                          f'For emergencies, call {info["phone_emergency"]}.'
+            for hospital_key, info in self.hospital_items
+        }
+
+    def specialize_templates(self, templates):
+        """Pre-fill the per-hospital invariants in a template table.
+
+        Stage one of a two-stage format: {hn} and {phone} are substituted
+        once per hospital while the {item*} placeholders are re-emitted
+        literally, leaving build_hospital_rows only the item fields to
+        fill per row. Each record carries a prototype row holding the
+        invariant category/hospital values, so the hot loop clones it
+        instead of assembling a fresh 4-key dict. Results are memoized
+        per table.
+        """
+        specialized = self._specialized_templates.get(templates)
+        if specialized is None:
+            passthrough = {'item': '{item}', 'item_l': '{item_l}', 'item_t': '{item_t}'}
+            specialized = tuple(
+                (hospital_key, tuple(
+                    (question_tpl.format_map(dict(passthrough, hn=info['name'], phone=info['phone_main'])),
+                     answer_tpl.format_map(dict(passthrough, hn=info['name'], phone=info['phone_main'])),
+                     {'question': '', 'answer': '', 'category': category, 'hospital': hospital_key})
+                    for question_tpl, answer_tpl, category in templates
+                ))
+                for hospital_key, info in self.hospital_items
+            )
+            self._specialized_templates[templates] = specialized
+        return specialized
+
+    def build_hospital_rows(self, items, templates):
+        """Build Q&A rows for every item x hospital x template combination.
+
+        Shared bulk builder for the rectangular generators: one loop fills
+        a context dict and formats the shared template table instead of
+        each method constructing its own dict literals inline. Hospital
+        name and phone are baked into the templates up front, so each row
+        needs a single substitution pass.
+        """
+        rows = []
+        append = rows.append
+        ctx = {}
+        last_item = None
+        per_hospital = self.specialize_templates(templates)
+
+        # product() enumerates item x hospital in C, replacing one level
+        # of nested Python for-loops; items vary slowest, matching the
+        # original row order.
+        for item, (hospital_key, hospital_templates) in product(items, per_hospital):
+            if item is not last_item:
+                ctx['item'] = item
+                ctx['item_l'] = item.lower()
+                ctx['item_t'] = item.title()
+                last_item = item
+            for question_tpl, answer_tpl, prototype in hospital_templates:
+                row = prototype.copy()
+                row['question'] = question_tpl.format_map(ctx)
+                row['answer'] = answer_tpl.format_map(ctx)
+                append(row)
+
+        return rows
+
     def generate_contact_information(self):
         """Generate contact and basic information Q&A pairs"""
         contact_data = []
         
-        for hospital_key, info in self.hospitals.items():
+        for hospital_key, info in self.hospital_items:
             hospital_name = info['name']
             
-            contact_data.extend([
-                {
-                    'question': f'How do I contact {hospital_name}?',
-                    'answer': f'You can contact {hospital_name} at {info["phone_main"]}. They are available 24/7 for emergencies.',
-                    'category': 'contact',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'What is the emergency number for {hospital_name}?',
-                    'answer': f'Emergency contact for {hospital_name}: {info["phone_emergency"]}. Available 24/7 for urgent medical situations.',
-                    'category': 'emergency',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Where is {hospital_name} located?',
-                    'answer': f'{hospital_name} is located at {info["location"]}. Easily accessible by public transport with parking available.',
-                    'category': 'location',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'What is the website for {hospital_name}?',
-                    'answer': f'Visit {info["website"]} for online services, appointments, and information about {hospital_name}.',
-                    'category': 'website',
-                    'hospital': hospital_key
-                }
-            ])
+            contact_data.append({
+                'question': f'How do I contact {hospital_name}?',
+                'answer': f'You can contact {hospital_name} at {info["phone_main"]}. They are available 24/7 for emergencies.',
+                'category': 'contact',
+                'hospital': hospital_key
+            })
+            contact_data.append({
+                'question': f'What is the emergency number for {hospital_name}?',
+                'answer': f'Emergency contact for {hospital_name}: {info["phone_emergency"]}. Available 24/7 for urgent medical situations.',
+                'category': 'emergency',
+                'hospital': hospital_key
+            })
+            contact_data.append({
+                'question': f'Where is {hospital_name} located?',
+                'answer': f'{hospital_name} is located at {info["location"]}. Easily accessible by public transport with parking available.',
+                'category': 'location',
+                'hospital': hospital_key
+            })
+            contact_data.append({
+                'question': f'What is the website for {hospital_name}?',
+                'answer': f'Visit {info["website"]} for online services, appointments, and information about {hospital_name}.',
+                'category': 'website',
+                'hospital': hospital_key
+            })
         
         return contact_data
     
@@ -170,39 +388,32 @@ class HospitalDataGenerator:
     
     def generate_department_information(self):
         """Generate comprehensive department information"""
-        departments = [
-            'Cardiology', 'Neurology', 'Oncology', 'Pediatrics', 'Orthopedics',
-            'Radiology', 'Emergency Medicine', 'Maternity', 'Surgery',
-            'Internal Medicine', 'Psychiatry', 'Dermatology', 'Ophthalmology',
-            'ENT', 'Gynecology', 'Urology', 'Nephrology', 'Endocrinology'
-        ]
-        
         department_data = []
-        
+        append = department_data.append
+
         # General department question
-        department_data.append({
+        append({
             'question': 'What departments are available at both hospitals?',
-            'answer': f'Major departments include: {", ".join(departments)}. Both hospitals have qualified specialists and modern equipment.',
+            'answer': self.departments_overview_answer,
             'category': 'departments',
             'hospital': 'both'
         })
-        
+
         # Specific department questions
-        for dept in departments:
-            department_data.extend([
-                {
-                    'question': f'Do you have {dept.lower()} services?',
-                    'answer': f'Yes, both hospitals have {dept} departments with qualified specialists and modern equipment. Appointment booking required.',
-                    'category': 'departments',
-                    'hospital': 'both'
-                },
-                {
-                    'question': f'How do I book a {dept.lower()} appointment?',
-                    'answer': f'For {dept} appointments, call the hospital directly or visit in person. Nairobi Hospital: +254-20-2845000, Kenyatta: +254-20-2726300.',
-                    'category': 'appointment',
-                    'hospital': 'both'
-                }
-            ])
+        for dept in self.core_departments:
+            dept_lower = dept.lower()
+            append({
+                'question': f'Do you have {dept_lower} services?',
+                'answer': f'Yes, both hospitals have {dept} departments with qualified specialists and modern equipment. Appointment booking required.',
+                'category': 'departments',
+                'hospital': 'both'
+            })
+            append({
+                'question': f'How do I book a {dept_lower} appointment?',
+                'answer': f'For {dept} appointments, call the hospital directly or visit in person. {self.both_contacts}.',
+                'category': 'appointment',
+                'hospital': 'both'
+            })
         
         return department_data
     
@@ -291,13 +502,13 @@ class HospitalDataGenerator:
             },
             {
                 'question': 'Do you have an ambulance service?',
-                'answer': 'Yes, both hospitals provide ambulance services. Nairobi Hospital: +254-20-2845000, Kenyatta National: +254-20-2726300. Available 24/7.',
+                'answer': f'Yes, both hospitals provide ambulance services. {self.both_contacts_full}. Available 24/7.',
                 'category': 'emergency',
                 'hospital': 'both'
             },
             {
                 'question': 'What should I do in a medical emergency?',
-                'answer': 'Call the hospital immediately. Nairobi Hospital: +254-20-2845000, Kenyatta: +254-20-2726300. For life-threatening situations, go directly to emergency department.',
+                'answer': f'Call the hospital immediately. {self.both_contacts}. For life-threatening situations, go directly to emergency department.',
                 'category': 'emergency',
                 'hospital': 'both'
             }
@@ -379,438 +590,351 @@ class HospitalDataGenerator:
         
         return specialized_data
     
-    def generate_comprehensive_dataset(self):
-        """Generate the complete comprehensive dataset with 1000+ entries"""
+    def stream_rows(self):
+        """Yield Q&A rows from every data category in order.
+
+        Streaming entry point: consumers that write rows straight to disk
+        can iterate this without holding the whole dataset in memory —
+        only one sub-generator's rows are alive at a time.
+        """
+        generators = (
+            self.generate_contact_information,
+            self.generate_appointment_information,
+            self.generate_visiting_hours,
+            self.generate_department_information,
+            self.generate_pricing_information,
+            self.generate_insurance_information,
+            self.generate_emergency_information,
+            self.generate_facility_information,
+            self.generate_specialized_services,
+
+            # NEW: Additional comprehensive data categories
+            self.generate_medical_conditions_qa,
+            self.generate_procedures_and_tests_qa,
+            self.generate_doctor_specialties_qa,
+            self.generate_patient_services_qa,
+            self.generate_health_screening_qa,
+            self.generate_medication_pharmacy_qa,
+            self.generate_laboratory_services_qa,
+            self.generate_radiology_imaging_qa,
+            self.generate_surgical_services_qa,
+            self.generate_maternity_pediatric_qa,
+            self.generate_nutrition_wellness_qa,
+            self.generate_rehabilitation_therapy_qa,
+            self.generate_preventive_care_qa,
+            self.generate_health_education_qa,
+            self.generate_administrative_qa,
+            self.generate_technology_equipment_qa,
+            self.generate_quality_accreditation_qa,
+            self.generate_community_outreach_qa,
+            self.generate_research_innovation_qa,
+            self.generate_staff_expertise_qa,
+
+            # ADDITIONAL: More detailed variations for reaching 1000+ rows
+            self.generate_detailed_symptom_qa,
+            self.generate_cost_coverage_variations,
+            self.generate_location_directions_qa,
+            self.generate_seasonal_health_qa,
+            self.generate_age_specific_care_qa,
+            self.generate_alternative_phrasing_qa,
+        )
+
+        # Record the category vocabulary on the way through so save_data
+        # does not need a second full pass over the rows
+        categories = self._categories
+        for generate in generators:
+            for row in generate():
+                categories.add(row['category'])
+                yield row
+
+    def dataset_cache_key(self):
+        """Content hash of everything that determines the generated rows.
+
+        The template tables, per-method item lists and literal answers
+        all live in this module's source, so the key hashes the file
+        itself alongside the instance reference data — any edit to the
+        generator invalidates the cache, not just hospital/config edits.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        with open(__file__, 'rb') as f:
+            hasher.update(f.read())
+        hasher.update(repr((self.hospitals, self.departments, self.core_departments,
+                            self.conditions, self.procedures)).encode('utf-8'))
+        return hasher.hexdigest()
+
+    def generate_comprehensive_dataset(self, use_cache=True):
+        """Generate the complete comprehensive dataset with 1000+ entries
+
+        Generation is deterministic, so the result is memoized on the
+        instance and cached on disk keyed by a hash of the reference
+        data; repeat calls and repeat runs with unchanged inputs skip
+        the rebuild entirely.
+        """
+        if use_cache and self._dataset_memo is not None:
+            return self._dataset_memo
+
         print("Generating extensive hospital dataset...")
-        
-        # Collect all data categories
-        all_data = []
-        all_data.extend(self.generate_contact_information())
-        all_data.extend(self.generate_appointment_information())
-        all_data.extend(self.generate_visiting_hours())
-        all_data.extend(self.generate_department_information())
-        all_data.extend(self.generate_pricing_information())
-        all_data.extend(self.generate_insurance_information())
-        all_data.extend(self.generate_emergency_information())
-        all_data.extend(self.generate_facility_information())
-        all_data.extend(self.generate_specialized_services())
-        
-        # NEW: Additional comprehensive data categories
-        all_data.extend(self.generate_medical_conditions_qa())
-        all_data.extend(self.generate_procedures_and_tests_qa())
-        all_data.extend(self.generate_doctor_specialties_qa())
-        all_data.extend(self.generate_patient_services_qa())
-        all_data.extend(self.generate_health_screening_qa())
-        all_data.extend(self.generate_medication_pharmacy_qa())
-        all_data.extend(self.generate_laboratory_services_qa())
-        all_data.extend(self.generate_radiology_imaging_qa())
-        all_data.extend(self.generate_surgical_services_qa())
-        all_data.extend(self.generate_maternity_pediatric_qa())
-        all_data.extend(self.generate_nutrition_wellness_qa())
-        all_data.extend(self.generate_rehabilitation_therapy_qa())
-        all_data.extend(self.generate_preventive_care_qa())
-        all_data.extend(self.generate_health_education_qa())
-        all_data.extend(self.generate_administrative_qa())
-        all_data.extend(self.generate_technology_equipment_qa())
-        all_data.extend(self.generate_quality_accreditation_qa())
-        all_data.extend(self.generate_community_outreach_qa())
-        all_data.extend(self.generate_research_innovation_qa())
-        all_data.extend(self.generate_staff_expertise_qa())
-        
-        # ADDITIONAL: More detailed variations for reaching 1000+ rows
-        all_data.extend(self.generate_detailed_symptom_qa())
-        all_data.extend(self.generate_cost_coverage_variations())
-        all_data.extend(self.generate_location_directions_qa())
-        all_data.extend(self.generate_seasonal_health_qa())
-        all_data.extend(self.generate_age_specific_care_qa())
-        all_data.extend(self.generate_alternative_phrasing_qa())
-        
+
+        cache_file = 'data/.generator_cache.json'
+        key = self.dataset_cache_key()
+
+        if use_cache and os.path.exists(cache_file):
+            try:
+                if ORJSON_AVAILABLE:
+                    with open(cache_file, 'rb') as f:
+                        cached = orjson.loads(f.read())
+                else:
+                    with open(cache_file, 'r', encoding='utf-8') as f:
+                        cached = json.load(f)
+                if cached.get('key') == key:
+                    all_data = cached['data']
+                    self._dataset_memo = all_data
+                    print(f"Loaded {len(all_data)} Q&A pairs from cache")
+                    return all_data
+            except (OSError, ValueError, KeyError):
+                pass  # Unreadable or stale cache; fall through and rebuild
+
+        # Collect all data categories through the streaming pipeline
+        all_data = list(self.stream_rows())
+
+        if use_cache:
+            try:
+                os.makedirs('data', exist_ok=True)
+                tmp_file = cache_file + '.tmp'
+                if ORJSON_AVAILABLE:
+                    with open(tmp_file, 'wb') as f:
+                        f.write(orjson.dumps({'key': key, 'data': all_data}))
+                else:
+                    with open(tmp_file, 'w', encoding='utf-8') as f:
+                        json.dump({'key': key, 'data': all_data}, f, ensure_ascii=False)
+                os.replace(tmp_file, cache_file)
+            except OSError:
+                pass  # Caching is best-effort; generation already succeeded
+
+        if use_cache:
+            self._dataset_memo = all_data
+
         print(f"Generated {len(all_data)} Q&A pairs")
         return all_data
 
     def generate_medical_conditions_qa(self):
         """Generate Q&A about medical conditions and treatments"""
-        conditions_data = []
-        
-        for condition in self.conditions:
-            for hospital_key, info in self.hospitals.items():
-                hospital_name = info['name']
-                
-                conditions_data.extend([
-                    {
-                        'question': f'Does {hospital_name} treat {condition.lower()}?',
-                        'answer': f'Yes, {hospital_name} has specialists and facilities to diagnose and treat {condition}. Our medical team provides comprehensive care with modern equipment and evidence-based treatments.',
-                        'category': 'medical_conditions',
-                        'hospital': hospital_key
-                    },
-                    {
-                        'question': f'What specialists treat {condition.lower()} at {hospital_name}?',
-                        'answer': f'At {hospital_name}, {condition} is treated by our qualified specialists in the relevant department. We have experienced doctors with specialized training in managing {condition.lower()}.',
-                        'category': 'medical_specialists',
-                        'hospital': hospital_key
-                    }
-                ])
-        
+        conditions_data = self.build_hospital_rows(self.conditions, CONDITION_TEMPLATES)
+
         # Add general condition management questions
-        for hospital_key, info in self.hospitals.items():
+        for hospital_key, info in self.hospital_items:
             hospital_name = info['name']
             
-            conditions_data.extend([
-                {
-                    'question': f'What chronic diseases does {hospital_name} manage?',
-                    'answer': f'{hospital_name} manages chronic conditions including diabetes, hypertension, heart disease, kidney disease, and arthritis. We provide comprehensive long-term care plans.',
-                    'category': 'chronic_care',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Does {hospital_name} have a diabetes clinic?',
-                    'answer': f'Yes, {hospital_name} has a dedicated diabetes clinic with endocrinologists, nutritionists, and diabetes educators to provide comprehensive diabetes management.',
-                    'category': 'specialty_clinics',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'What cancer treatments are available at {hospital_name}?',
-                    'answer': f'{hospital_name} offers comprehensive cancer care including chemotherapy, radiotherapy, surgical oncology, and palliative care with a multidisciplinary team approach.',
-                    'category': 'oncology',
-                    'hospital': hospital_key
-                }
-            ])
+            conditions_data.append({
+                'question': f'What chronic diseases does {hospital_name} manage?',
+                'answer': f'{hospital_name} manages chronic conditions including diabetes, hypertension, heart disease, kidney disease, and arthritis. We provide comprehensive long-term care plans.',
+                'category': 'chronic_care',
+                'hospital': hospital_key
+            })
+            conditions_data.append({
+                'question': f'Does {hospital_name} have a diabetes clinic?',
+                'answer': f'Yes, {hospital_name} has a dedicated diabetes clinic with endocrinologists, nutritionists, and diabetes educators to provide comprehensive diabetes management.',
+                'category': 'specialty_clinics',
+                'hospital': hospital_key
+            })
+            conditions_data.append({
+                'question': f'What cancer treatments are available at {hospital_name}?',
+                'answer': f'{hospital_name} offers comprehensive cancer care including chemotherapy, radiotherapy, surgical oncology, and palliative care with a multidisciplinary team approach.',
+                'category': 'oncology',
+                'hospital': hospital_key
+            })
         
         return conditions_data
 
     def generate_procedures_and_tests_qa(self):
         """Generate Q&A about medical procedures and diagnostic tests"""
-        procedures_data = []
-        
-        for procedure in self.procedures:
-            for hospital_key, info in self.hospitals.items():
-                hospital_name = info['name']
-                
-                procedures_data.extend([
-                    {
-                        'question': f'Does {hospital_name} offer {procedure.lower()}?',
-                        'answer': f'Yes, {hospital_name} provides {procedure} services with modern equipment and qualified technicians. Please call {info["phone_main"]} to schedule an appointment.',
-                        'category': 'procedures',
-                        'hospital': hospital_key
-                    },
-                    {
-                        'question': f'How do I prepare for {procedure.lower()} at {hospital_name}?',
-                        'answer': f'Preparation instructions for {procedure} will be provided when you schedule your appointment at {hospital_name}. Our staff will guide you through any specific requirements.',
-                        'category': 'procedure_preparation',
-                        'hospital': hospital_key
-                    },
-                    {
-                        'question': f'How long does {procedure.lower()} take at {hospital_name}?',
-                        'answer': f'The duration of {procedure} varies depending on individual cases. Our medical team at {hospital_name} will provide you with specific timing information during consultation.',
-                        'category': 'procedure_duration',
-                        'hospital': hospital_key
-                    }
-                ])
-        
-        return procedures_data
+        return self.build_hospital_rows(self.procedures, PROCEDURE_TEMPLATES)
 
     def generate_doctor_specialties_qa(self):
         """Generate Q&A about doctor specialties and qualifications"""
-        doctors_data = []
-        
-        for department in self.departments:
-            for hospital_key, info in self.hospitals.items():
-                hospital_name = info['name']
-                
-                doctors_data.extend([
-                    {
-                        'question': f'Who are the {department.lower()} doctors at {hospital_name}?',
-                        'answer': f'{hospital_name} has qualified {department.lower()} specialists with extensive training and experience. Our doctors are board-certified and provide expert medical care.',
-                        'category': 'doctor_profiles',
-                        'hospital': hospital_key
-                    },
-                    {
-                        'question': f'How do I book with a {department.lower()} specialist at {hospital_name}?',
-                        'answer': f'To book with a {department.lower()} specialist at {hospital_name}, call {info["phone_main"]} or visit the hospital. Referrals may be required for some specialties.',
-                        'category': 'specialist_booking',
-                        'hospital': hospital_key
-                    },
-                    {
-                        'question': f'What qualifications do {department.lower()} doctors have at {hospital_name}?',
-                        'answer': f'Our {department.lower()} doctors at {hospital_name} have medical degrees, specialized training, and are registered with the Kenya Medical Practitioners and Dentists Council.',
-                        'category': 'doctor_qualifications',
-                        'hospital': hospital_key
-                    }
-                ])
-        
-        return doctors_data
+        return self.build_hospital_rows(self.departments, DOCTOR_TEMPLATES)
 
     def generate_patient_services_qa(self):
         """Generate Q&A about patient services and amenities"""
         services_data = []
         
-        for hospital_key, info in self.hospitals.items():
+        for hospital_key, info in self.hospital_items:
             hospital_name = info['name']
             
-            services_data.extend([
-                {
-                    'question': f'What patient services are available at {hospital_name}?',
-                    'answer': f'{hospital_name} offers patient registration, medical records, discharge planning, social services, chaplaincy, and patient advocacy services.',
-                    'category': 'patient_services',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Does {hospital_name} have wheelchair accessibility?',
-                    'answer': f'Yes, {hospital_name} is fully wheelchair accessible with ramps, elevators, and accessible restrooms throughout the facility.',
-                    'category': 'accessibility',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Is there parking available at {hospital_name}?',
-                    'answer': f'Yes, {hospital_name} provides parking facilities for patients and visitors. Both free and paid parking options may be available.',
-                    'category': 'parking',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Does {hospital_name} have a cafeteria?',
-                    'answer': f'Yes, {hospital_name} has dining facilities including a cafeteria and may have vending machines for patients, visitors, and staff.',
-                    'category': 'dining',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'What languages are spoken at {hospital_name}?',
-                    'answer': f'{hospital_name} staff primarily speak English and Swahili. Translation services may be available for other languages when needed.',
-                    'category': 'languages',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Does {hospital_name} have a gift shop?',
-                    'answer': f'{hospital_name} may have a gift shop or convenience store for patients and visitors. Please check with reception for current availability.',
-                    'category': 'amenities',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Is Wi-Fi available at {hospital_name}?',
-                    'answer': f'Yes, {hospital_name} provides Wi-Fi access for patients and visitors in designated areas. Ask reception for connection details.',
-                    'category': 'wifi',
-                    'hospital': hospital_key
-                }
-            ])
+            services_data.append({
+                'question': f'What patient services are available at {hospital_name}?',
+                'answer': f'{hospital_name} offers patient registration, medical records, discharge planning, social services, chaplaincy, and patient advocacy services.',
+                'category': 'patient_services',
+                'hospital': hospital_key
+            })
+            services_data.append({
+                'question': f'Does {hospital_name} have wheelchair accessibility?',
+                'answer': f'Yes, {hospital_name} is fully wheelchair accessible with ramps, elevators, and accessible restrooms throughout the facility.',
+                'category': 'accessibility',
+                'hospital': hospital_key
+            })
+            services_data.append({
+                'question': f'Is there parking available at {hospital_name}?',
+                'answer': f'Yes, {hospital_name} provides parking facilities for patients and visitors. Both free and paid parking options may be available.',
+                'category': 'parking',
+                'hospital': hospital_key
+            })
+            services_data.append({
+                'question': f'Does {hospital_name} have a cafeteria?',
+                'answer': f'Yes, {hospital_name} has dining facilities including a cafeteria and may have vending machines for patients, visitors, and staff.',
+                'category': 'dining',
+                'hospital': hospital_key
+            })
+            services_data.append({
+                'question': f'What languages are spoken at {hospital_name}?',
+                'answer': f'{hospital_name} staff primarily speak English and Swahili. Translation services may be available for other languages when needed.',
+                'category': 'languages',
+                'hospital': hospital_key
+            })
+            services_data.append({
+                'question': f'Does {hospital_name} have a gift shop?',
+                'answer': f'{hospital_name} may have a gift shop or convenience store for patients and visitors. Please check with reception for current availability.',
+                'category': 'amenities',
+                'hospital': hospital_key
+            })
+            services_data.append({
+                'question': f'Is Wi-Fi available at {hospital_name}?',
+                'answer': f'Yes, {hospital_name} provides Wi-Fi access for patients and visitors in designated areas. Ask reception for connection details.',
+                'category': 'wifi',
+                'hospital': hospital_key
+            })
         
         return services_data
 
     def generate_health_screening_qa(self):
         """Generate Q&A about health screening and preventive care"""
-        screening_data = []
-        
-        screenings = [
+        screenings = (
             'General health checkup', 'Cancer screening', 'Heart screening',
             'Diabetes screening', 'Blood pressure check', 'Cholesterol test',
             'Eye examination', 'Dental checkup', 'Mammography', 'Pap smear',
             'Prostate screening', 'Bone density test', 'Mental health assessment'
-        ]
-        
-        for screening in screenings:
-            for hospital_key, info in self.hospitals.items():
-                hospital_name = info['name']
-                
-                screening_data.extend([
-                    {
-                        'question': f'Does {hospital_name} offer {screening.lower()}?',
-                        'answer': f'Yes, {hospital_name} provides {screening.lower()} services as part of our preventive care program. Early detection is key to better health outcomes.',
-                        'category': 'health_screening',
-                        'hospital': hospital_key
-                    },
-                    {
-                        'question': f'How often should I get {screening.lower()} at {hospital_name}?',
-                        'answer': f'The frequency of {screening.lower()} depends on your age, risk factors, and medical history. Consult with our doctors at {hospital_name} for personalized recommendations.',
-                        'category': 'screening_frequency',
-                        'hospital': hospital_key
-                    }
-                ])
-        
-        return screening_data
+        )
+
+        return self.build_hospital_rows(screenings, SCREENING_TEMPLATES)
 
     def generate_medication_pharmacy_qa(self):
         """Generate Q&A about pharmacy and medication services"""
         pharmacy_data = []
         
-        for hospital_key, info in self.hospitals.items():
+        for hospital_key, info in self.hospital_items:
             hospital_name = info['name']
             
-            pharmacy_data.extend([
-                {
-                    'question': f'Does {hospital_name} have a pharmacy?',
-                    'answer': f'Yes, {hospital_name} has an on-site pharmacy that stocks a wide range of medications, including prescription drugs, over-the-counter medicines, and medical supplies.',
-                    'category': 'pharmacy',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'What are the pharmacy hours at {hospital_name}?',
-                    'answer': f'The pharmacy at {hospital_name} typically operates during regular hospital hours. Emergency medications are available 24/7 through the hospital pharmacy.',
-                    'category': 'pharmacy_hours',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Can I get my prescription filled at {hospital_name}?',
-                    'answer': f'Yes, you can get prescriptions filled at the {hospital_name} pharmacy. Bring your prescription and identification for processing.',
-                    'category': 'prescription_filling',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Does {hospital_name} pharmacy accept insurance?',
-                    'answer': f'The {hospital_name} pharmacy accepts various insurance plans. Check with the pharmacy staff to verify your insurance coverage for medications.',
-                    'category': 'pharmacy_insurance',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Can I get medication counseling at {hospital_name}?',
-                    'answer': f'Yes, the pharmacists at {hospital_name} provide medication counseling, including dosage instructions, side effects, and drug interactions.',
-                    'category': 'medication_counseling',
-                    'hospital': hospital_key
-                }
-            ])
+            pharmacy_data.append({
+                'question': f'Does {hospital_name} have a pharmacy?',
+                'answer': f'Yes, {hospital_name} has an on-site pharmacy that stocks a wide range of medications, including prescription drugs, over-the-counter medicines, and medical supplies.',
+                'category': 'pharmacy',
+                'hospital': hospital_key
+            })
+            pharmacy_data.append({
+                'question': f'What are the pharmacy hours at {hospital_name}?',
+                'answer': f'The pharmacy at {hospital_name} typically operates during regular hospital hours. Emergency medications are available 24/7 through the hospital pharmacy.',
+                'category': 'pharmacy_hours',
+                'hospital': hospital_key
+            })
+            pharmacy_data.append({
+                'question': f'Can I get my prescription filled at {hospital_name}?',
+                'answer': f'Yes, you can get prescriptions filled at the {hospital_name} pharmacy. Bring your prescription and identification for processing.',
+                'category': 'prescription_filling',
+                'hospital': hospital_key
+            })
+            pharmacy_data.append({
+                'question': f'Does {hospital_name} pharmacy accept insurance?',
+                'answer': f'The {hospital_name} pharmacy accepts various insurance plans. Check with the pharmacy staff to verify your insurance coverage for medications.',
+                'category': 'pharmacy_insurance',
+                'hospital': hospital_key
+            })
+            pharmacy_data.append({
+                'question': f'Can I get medication counseling at {hospital_name}?',
+                'answer': f'Yes, the pharmacists at {hospital_name} provide medication counseling, including dosage instructions, side effects, and drug interactions.',
+                'category': 'medication_counseling',
+                'hospital': hospital_key
+            })
         
         return pharmacy_data
 
     def generate_laboratory_services_qa(self):
         """Generate Q&A about laboratory and diagnostic services"""
-        lab_data = []
-        
-        lab_tests = [
+        lab_tests = (
             'Blood test', 'Urine test', 'Stool test', 'HIV test', 'Hepatitis test',
             'Pregnancy test', 'Thyroid test', 'Liver function test', 'Kidney function test',
             'Cardiac markers', 'Tumor markers', 'Hormone tests', 'Allergy tests'
-        ]
-        
-        for test in lab_tests:
-            for hospital_key, info in self.hospitals.items():
-                hospital_name = info['name']
-                
-                lab_data.extend([
-                    {
-                        'question': f'Does {hospital_name} do {test.lower()}?',
-                        'answer': f'Yes, {hospital_name} laboratory provides {test.lower()} with accurate results and quick turnaround times using modern equipment.',
-                        'category': 'laboratory_tests',
-                        'hospital': hospital_key
-                    },
-                    {
-                        'question': f'How long do {test.lower()} results take at {hospital_name}?',
-                        'answer': f'{test.title()} results at {hospital_name} are typically available within 24-48 hours. Urgent tests may be processed faster when needed.',
-                        'category': 'lab_results_time',
-                        'hospital': hospital_key
-                    }
-                ])
-        
-        for hospital_key, info in self.hospitals.items():
+        )
+
+        lab_data = self.build_hospital_rows(lab_tests, LAB_TEST_TEMPLATES)
+
+        for hospital_key, info in self.hospital_items:
             hospital_name = info['name']
             
-            lab_data.extend([
-                {
-                    'question': f'What are the laboratory hours at {hospital_name}?',
-                    'answer': f'The laboratory at {hospital_name} typically operates from 6:00 AM to 6:00 PM on weekdays. Emergency lab services are available 24/7.',
-                    'category': 'lab_hours',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Do I need to fast for blood tests at {hospital_name}?',
-                    'answer': f'Fasting requirements depend on the specific blood test. The laboratory staff at {hospital_name} will inform you of any fasting requirements when scheduling.',
-                    'category': 'lab_preparation',
-                    'hospital': hospital_key
-                }
-            ])
+            lab_data.append({
+                'question': f'What are the laboratory hours at {hospital_name}?',
+                'answer': f'The laboratory at {hospital_name} typically operates from 6:00 AM to 6:00 PM on weekdays. Emergency lab services are available 24/7.',
+                'category': 'lab_hours',
+                'hospital': hospital_key
+            })
+            lab_data.append({
+                'question': f'Do I need to fast for blood tests at {hospital_name}?',
+                'answer': f'Fasting requirements depend on the specific blood test. The laboratory staff at {hospital_name} will inform you of any fasting requirements when scheduling.',
+                'category': 'lab_preparation',
+                'hospital': hospital_key
+            })
         
         return lab_data
 
     def generate_radiology_imaging_qa(self):
         """Generate Q&A about radiology and imaging services"""
-        radiology_data = []
-        
-        imaging_types = [
+        imaging_types = (
             'X-ray', 'CT scan', 'MRI', 'Ultrasound', 'Mammogram',
             'Bone scan', 'Nuclear medicine', 'Fluoroscopy', 'PET scan'
-        ]
-        
-        for imaging in imaging_types:
-            for hospital_key, info in self.hospitals.items():
-                hospital_name = info['name']
-                
-                radiology_data.extend([
-                    {
-                        'question': f'Does {hospital_name} have {imaging.lower()} services?',
-                        'answer': f'Yes, {hospital_name} radiology department provides {imaging.lower()} services with state-of-the-art equipment and qualified radiologists.',
-                        'category': 'radiology',
-                        'hospital': hospital_key
-                    },
-                    {
-                        'question': f'How do I schedule {imaging.lower()} at {hospital_name}?',
-                        'answer': f'To schedule {imaging.lower()} at {hospital_name}, you need a doctor\'s referral. Call {info["phone_main"]} or visit the radiology department.',
-                        'category': 'imaging_scheduling',
-                        'hospital': hospital_key
-                    }
-                ])
-        
-        return radiology_data
+        )
+
+        return self.build_hospital_rows(imaging_types, IMAGING_TEMPLATES)
 
     def generate_surgical_services_qa(self):
         """Generate Q&A about surgical services and procedures"""
-        surgery_data = []
-        
-        surgery_types = [
+        surgery_types = (
             'General surgery', 'Cardiac surgery', 'Neurosurgery', 'Orthopedic surgery',
             'Plastic surgery', 'Gynecological surgery', 'Urological surgery',
             'ENT surgery', 'Eye surgery', 'Emergency surgery', 'Minimally invasive surgery'
-        ]
-        
-        for surgery in surgery_types:
-            for hospital_key, info in self.hospitals.items():
-                hospital_name = info['name']
-                
-                surgery_data.extend([
-                    {
-                        'question': f'Does {hospital_name} perform {surgery.lower()}?',
-                        'answer': f'Yes, {hospital_name} has qualified surgeons and modern operating theaters for {surgery.lower()} with comprehensive pre and post-operative care.',
-                        'category': 'surgical_services',
-                        'hospital': hospital_key
-                    },
-                    {
-                        'question': f'What should I expect before {surgery.lower()} at {hospital_name}?',
-                        'answer': f'Before {surgery.lower()} at {hospital_name}, you\'ll have pre-operative consultations, tests, and receive detailed instructions about preparation and recovery.',
-                        'category': 'pre_surgery',
-                        'hospital': hospital_key
-                    }
-                ])
-        
-        return surgery_data
+        )
+
+        return self.build_hospital_rows(surgery_types, SURGERY_TEMPLATES)
 
     def generate_maternity_pediatric_qa(self):
         """Generate Q&A about maternity and pediatric services"""
         maternity_data = []
         
-        for hospital_key, info in self.hospitals.items():
+        for hospital_key, info in self.hospital_items:
             hospital_name = info['name']
             
-            maternity_data.extend([
-                {
-                    'question': f'Does {hospital_name} have maternity services?',
-                    'answer': f'Yes, {hospital_name} provides comprehensive maternity care including prenatal care, delivery services, and postnatal care with qualified obstetricians.',
-                    'category': 'maternity',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'What pediatric services are available at {hospital_name}?',
-                    'answer': f'{hospital_name} offers complete pediatric care for children from newborns to adolescents, including routine checkups, vaccinations, and specialized pediatric treatments.',
-                    'category': 'pediatrics',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Does {hospital_name} have a NICU?',
-                    'answer': f'Yes, {hospital_name} has a Neonatal Intensive Care Unit (NICU) equipped with advanced technology to care for premature and critically ill newborns.',
-                    'category': 'nicu',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'What vaccination services does {hospital_name} offer?',
-                    'answer': f'{hospital_name} provides comprehensive vaccination services for children and adults, following national immunization guidelines and travel medicine recommendations.',
-                    'category': 'vaccinations',
-                    'hospital': hospital_key
-                }
-            ])
+            maternity_data.append({
+                'question': f'Does {hospital_name} have maternity services?',
+                'answer': f'Yes, {hospital_name} provides comprehensive maternity care including prenatal care, delivery services, and postnatal care with qualified obstetricians.',
+                'category': 'maternity',
+                'hospital': hospital_key
+            })
+            maternity_data.append({
+                'question': f'What pediatric services are available at {hospital_name}?',
+                'answer': f'{hospital_name} offers complete pediatric care for children from newborns to adolescents, including routine checkups, vaccinations, and specialized pediatric treatments.',
+                'category': 'pediatrics',
+                'hospital': hospital_key
+            })
+            maternity_data.append({
+                'question': f'Does {hospital_name} have a NICU?',
+                'answer': f'Yes, {hospital_name} has a Neonatal Intensive Care Unit (NICU) equipped with advanced technology to care for premature and critically ill newborns.',
+                'category': 'nicu',
+                'hospital': hospital_key
+            })
+            maternity_data.append({
+                'question': f'What vaccination services does {hospital_name} offer?',
+                'answer': f'{hospital_name} provides comprehensive vaccination services for children and adults, following national immunization guidelines and travel medicine recommendations.',
+                'category': 'vaccinations',
+                'hospital': hospital_key
+            })
         
         return maternity_data
 
@@ -818,29 +942,27 @@ class HospitalDataGenerator:
         """Generate Q&A about nutrition and wellness services"""
         nutrition_data = []
         
-        for hospital_key, info in self.hospitals.items():
+        for hospital_key, info in self.hospital_items:
             hospital_name = info['name']
             
-            nutrition_data.extend([
-                {
-                    'question': f'Does {hospital_name} have nutrition counseling?',
-                    'answer': f'Yes, {hospital_name} has qualified nutritionists who provide dietary counseling for various health conditions and wellness goals.',
-                    'category': 'nutrition',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'What wellness programs does {hospital_name} offer?',
-                    'answer': f'{hospital_name} offers wellness programs including health education, fitness assessments, stress management, and lifestyle counseling.',
-                    'category': 'wellness',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Does {hospital_name} provide diabetic diet counseling?',
-                    'answer': f'Yes, {hospital_name} nutritionists specialize in diabetic diet planning and provide comprehensive dietary management for diabetes patients.',
-                    'category': 'diabetic_nutrition',
-                    'hospital': hospital_key
-                }
-            ])
+            nutrition_data.append({
+                'question': f'Does {hospital_name} have nutrition counseling?',
+                'answer': f'Yes, {hospital_name} has qualified nutritionists who provide dietary counseling for various health conditions and wellness goals.',
+                'category': 'nutrition',
+                'hospital': hospital_key
+            })
+            nutrition_data.append({
+                'question': f'What wellness programs does {hospital_name} offer?',
+                'answer': f'{hospital_name} offers wellness programs including health education, fitness assessments, stress management, and lifestyle counseling.',
+                'category': 'wellness',
+                'hospital': hospital_key
+            })
+            nutrition_data.append({
+                'question': f'Does {hospital_name} provide diabetic diet counseling?',
+                'answer': f'Yes, {hospital_name} nutritionists specialize in diabetic diet planning and provide comprehensive dietary management for diabetes patients.',
+                'category': 'diabetic_nutrition',
+                'hospital': hospital_key
+            })
         
         return nutrition_data
 
@@ -854,17 +976,15 @@ class HospitalDataGenerator:
         ]
         
         for therapy in therapy_types:
-            for hospital_key, info in self.hospitals.items():
+            for hospital_key, info in self.hospital_items:
                 hospital_name = info['name']
                 
-                therapy_data.extend([
-                    {
-                        'question': f'Does {hospital_name} offer {therapy.lower()}?',
-                        'answer': f'Yes, {hospital_name} provides {therapy.lower()} services with qualified therapists and modern rehabilitation equipment.',
-                        'category': 'rehabilitation',
-                        'hospital': hospital_key
-                    }
-                ])
+                therapy_data.append({
+                    'question': f'Does {hospital_name} offer {therapy.lower()}?',
+                    'answer': f'Yes, {hospital_name} provides {therapy.lower()} services with qualified therapists and modern rehabilitation equipment.',
+                    'category': 'rehabilitation',
+                    'hospital': hospital_key
+                })
         
         return therapy_data
 
@@ -872,23 +992,21 @@ class HospitalDataGenerator:
         """Generate Q&A about preventive care and health maintenance"""
         preventive_data = []
         
-        for hospital_key, info in self.hospitals.items():
+        for hospital_key, info in self.hospital_items:
             hospital_name = info['name']
             
-            preventive_data.extend([
-                {
-                    'question': f'What preventive care services does {hospital_name} offer?',
-                    'answer': f'{hospital_name} offers comprehensive preventive care including routine checkups, screenings, vaccinations, and health education programs.',
-                    'category': 'preventive_care',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Does {hospital_name} offer executive health packages?',
-                    'answer': f'Yes, {hospital_name} provides executive health packages with comprehensive health assessments tailored for busy professionals.',
-                    'category': 'executive_health',
-                    'hospital': hospital_key
-                }
-            ])
+            preventive_data.append({
+                'question': f'What preventive care services does {hospital_name} offer?',
+                'answer': f'{hospital_name} offers comprehensive preventive care including routine checkups, screenings, vaccinations, and health education programs.',
+                'category': 'preventive_care',
+                'hospital': hospital_key
+            })
+            preventive_data.append({
+                'question': f'Does {hospital_name} offer executive health packages?',
+                'answer': f'Yes, {hospital_name} provides executive health packages with comprehensive health assessments tailored for busy professionals.',
+                'category': 'executive_health',
+                'hospital': hospital_key
+            })
         
         return preventive_data
 
@@ -896,23 +1014,21 @@ class HospitalDataGenerator:
         """Generate Q&A about health education and community programs"""
         education_data = []
         
-        for hospital_key, info in self.hospitals.items():
+        for hospital_key, info in self.hospital_items:
             hospital_name = info['name']
             
-            education_data.extend([
-                {
-                    'question': f'Does {hospital_name} offer health education programs?',
-                    'answer': f'Yes, {hospital_name} conducts health education programs on various topics including disease prevention, healthy lifestyle, and chronic disease management.',
-                    'category': 'health_education',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Does {hospital_name} have support groups?',
-                    'answer': f'{hospital_name} facilitates support groups for patients with chronic conditions, providing peer support and education.',
-                    'category': 'support_groups',
-                    'hospital': hospital_key
-                }
-            ])
+            education_data.append({
+                'question': f'Does {hospital_name} offer health education programs?',
+                'answer': f'Yes, {hospital_name} conducts health education programs on various topics including disease prevention, healthy lifestyle, and chronic disease management.',
+                'category': 'health_education',
+                'hospital': hospital_key
+            })
+            education_data.append({
+                'question': f'Does {hospital_name} have support groups?',
+                'answer': f'{hospital_name} facilitates support groups for patients with chronic conditions, providing peer support and education.',
+                'category': 'support_groups',
+                'hospital': hospital_key
+            })
         
         return education_data
 
@@ -920,29 +1036,27 @@ class HospitalDataGenerator:
         """Generate Q&A about administrative services"""
         admin_data = []
         
-        for hospital_key, info in self.hospitals.items():
+        for hospital_key, info in self.hospital_items:
             hospital_name = info['name']
             
-            admin_data.extend([
-                {
-                    'question': f'How do I get medical records from {hospital_name}?',
-                    'answer': f'To obtain medical records from {hospital_name}, visit the medical records department with proper identification and complete the required forms.',
-                    'category': 'medical_records',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'What are the admission procedures at {hospital_name}?',
-                    'answer': f'Hospital admission at {hospital_name} requires a doctor\'s referral, insurance verification, and completion of admission forms at the registration desk.',
-                    'category': 'admission',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'How do I make a complaint at {hospital_name}?',
-                    'answer': f'You can file complaints at {hospital_name} through the patient relations office, suggestion boxes, or by speaking with the administration.',
-                    'category': 'complaints',
-                    'hospital': hospital_key
-                }
-            ])
+            admin_data.append({
+                'question': f'How do I get medical records from {hospital_name}?',
+                'answer': f'To obtain medical records from {hospital_name}, visit the medical records department with proper identification and complete the required forms.',
+                'category': 'medical_records',
+                'hospital': hospital_key
+            })
+            admin_data.append({
+                'question': f'What are the admission procedures at {hospital_name}?',
+                'answer': f'Hospital admission at {hospital_name} requires a doctor\'s referral, insurance verification, and completion of admission forms at the registration desk.',
+                'category': 'admission',
+                'hospital': hospital_key
+            })
+            admin_data.append({
+                'question': f'How do I make a complaint at {hospital_name}?',
+                'answer': f'You can file complaints at {hospital_name} through the patient relations office, suggestion boxes, or by speaking with the administration.',
+                'category': 'complaints',
+                'hospital': hospital_key
+            })
         
         return admin_data
 
@@ -950,23 +1064,21 @@ class HospitalDataGenerator:
         """Generate Q&A about medical technology and equipment"""
         tech_data = []
         
-        for hospital_key, info in self.hospitals.items():
+        for hospital_key, info in self.hospital_items:
             hospital_name = info['name']
             
-            tech_data.extend([
-                {
-                    'question': f'What medical equipment does {hospital_name} have?',
-                    'answer': f'{hospital_name} is equipped with modern medical technology including advanced imaging equipment, surgical instruments, and monitoring devices.',
-                    'category': 'medical_equipment',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Does {hospital_name} have telemedicine services?',
-                    'answer': f'{hospital_name} may offer telemedicine consultations for certain conditions. Contact the hospital to inquire about virtual consultation options.',
-                    'category': 'telemedicine',
-                    'hospital': hospital_key
-                }
-            ])
+            tech_data.append({
+                'question': f'What medical equipment does {hospital_name} have?',
+                'answer': f'{hospital_name} is equipped with modern medical technology including advanced imaging equipment, surgical instruments, and monitoring devices.',
+                'category': 'medical_equipment',
+                'hospital': hospital_key
+            })
+            tech_data.append({
+                'question': f'Does {hospital_name} have telemedicine services?',
+                'answer': f'{hospital_name} may offer telemedicine consultations for certain conditions. Contact the hospital to inquire about virtual consultation options.',
+                'category': 'telemedicine',
+                'hospital': hospital_key
+            })
         
         return tech_data
 
@@ -974,23 +1086,21 @@ class HospitalDataGenerator:
         """Generate Q&A about quality standards and accreditation"""
         quality_data = []
         
-        for hospital_key, info in self.hospitals.items():
+        for hospital_key, info in self.hospital_items:
             hospital_name = info['name']
             
-            quality_data.extend([
-                {
-                    'question': f'What quality standards does {hospital_name} maintain?',
-                    'answer': f'{hospital_name} maintains high quality standards and may be accredited by relevant medical organizations ensuring safe and effective patient care.',
-                    'category': 'quality_standards',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Is {hospital_name} accredited?',
-                    'answer': f'{hospital_name} works to meet national and international healthcare standards and maintains accreditation from relevant medical authorities.',
-                    'category': 'accreditation',
-                    'hospital': hospital_key
-                }
-            ])
+            quality_data.append({
+                'question': f'What quality standards does {hospital_name} maintain?',
+                'answer': f'{hospital_name} maintains high quality standards and may be accredited by relevant medical organizations ensuring safe and effective patient care.',
+                'category': 'quality_standards',
+                'hospital': hospital_key
+            })
+            quality_data.append({
+                'question': f'Is {hospital_name} accredited?',
+                'answer': f'{hospital_name} works to meet national and international healthcare standards and maintains accreditation from relevant medical authorities.',
+                'category': 'accreditation',
+                'hospital': hospital_key
+            })
         
         return quality_data
 
@@ -998,23 +1108,21 @@ class HospitalDataGenerator:
         """Generate Q&A about community outreach and social responsibility"""
         outreach_data = []
         
-        for hospital_key, info in self.hospitals.items():
+        for hospital_key, info in self.hospital_items:
             hospital_name = info['name']
             
-            outreach_data.extend([
-                {
-                    'question': f'Does {hospital_name} do community outreach?',
-                    'answer': f'Yes, {hospital_name} participates in community health programs, health camps, and educational initiatives to serve the broader community.',
-                    'category': 'community_outreach',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Does {hospital_name} offer charity care?',
-                    'answer': f'{hospital_name} may provide charity care and payment assistance programs for qualified patients who meet specific criteria.',
-                    'category': 'charity_care',
-                    'hospital': hospital_key
-                }
-            ])
+            outreach_data.append({
+                'question': f'Does {hospital_name} do community outreach?',
+                'answer': f'Yes, {hospital_name} participates in community health programs, health camps, and educational initiatives to serve the broader community.',
+                'category': 'community_outreach',
+                'hospital': hospital_key
+            })
+            outreach_data.append({
+                'question': f'Does {hospital_name} offer charity care?',
+                'answer': f'{hospital_name} may provide charity care and payment assistance programs for qualified patients who meet specific criteria.',
+                'category': 'charity_care',
+                'hospital': hospital_key
+            })
         
         return outreach_data
 
@@ -1022,23 +1130,21 @@ class HospitalDataGenerator:
         """Generate Q&A about research and medical innovation"""
         research_data = []
         
-        for hospital_key, info in self.hospitals.items():
+        for hospital_key, info in self.hospital_items:
             hospital_name = info['name']
             
-            research_data.extend([
-                {
-                    'question': f'Does {hospital_name} conduct medical research?',
-                    'answer': f'{hospital_name} may participate in medical research and clinical trials to advance healthcare and improve patient outcomes.',
-                    'category': 'medical_research',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Are clinical trials available at {hospital_name}?',
-                    'answer': f'{hospital_name} may offer clinical trials for certain conditions. Speak with your doctor about potential trial opportunities.',
-                    'category': 'clinical_trials',
-                    'hospital': hospital_key
-                }
-            ])
+            research_data.append({
+                'question': f'Does {hospital_name} conduct medical research?',
+                'answer': f'{hospital_name} may participate in medical research and clinical trials to advance healthcare and improve patient outcomes.',
+                'category': 'medical_research',
+                'hospital': hospital_key
+            })
+            research_data.append({
+                'question': f'Are clinical trials available at {hospital_name}?',
+                'answer': f'{hospital_name} may offer clinical trials for certain conditions. Speak with your doctor about potential trial opportunities.',
+                'category': 'clinical_trials',
+                'hospital': hospital_key
+            })
         
         return research_data
 
@@ -1046,145 +1152,88 @@ class HospitalDataGenerator:
         """Generate Q&A about medical staff and expertise"""
         staff_data = []
         
-        for hospital_key, info in self.hospitals.items():
+        for hospital_key, info in self.hospital_items:
             hospital_name = info['name']
             
-            staff_data.extend([
-                {
-                    'question': f'What is the experience level of doctors at {hospital_name}?',
-                    'answer': f'The doctors at {hospital_name} are highly qualified with extensive training, many years of experience, and ongoing professional development.',
-                    'category': 'doctor_experience',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Are the nurses at {hospital_name} qualified?',
-                    'answer': f'Yes, the nurses at {hospital_name} are licensed, professionally trained, and committed to providing excellent patient care.',
-                    'category': 'nursing_staff',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'What languages do staff speak at {hospital_name}?',
-                    'answer': f'Staff at {hospital_name} primarily speak English and Swahili, with some staff members speaking additional local languages.',
-                    'category': 'staff_languages',
-                    'hospital': hospital_key
-                }
-            ])
+            staff_data.append({
+                'question': f'What is the experience level of doctors at {hospital_name}?',
+                'answer': f'The doctors at {hospital_name} are highly qualified with extensive training, many years of experience, and ongoing professional development.',
+                'category': 'doctor_experience',
+                'hospital': hospital_key
+            })
+            staff_data.append({
+                'question': f'Are the nurses at {hospital_name} qualified?',
+                'answer': f'Yes, the nurses at {hospital_name} are licensed, professionally trained, and committed to providing excellent patient care.',
+                'category': 'nursing_staff',
+                'hospital': hospital_key
+            })
+            staff_data.append({
+                'question': f'What languages do staff speak at {hospital_name}?',
+                'answer': f'Staff at {hospital_name} primarily speak English and Swahili, with some staff members speaking additional local languages.',
+                'category': 'staff_languages',
+                'hospital': hospital_key
+            })
         
         return staff_data
 
     def generate_detailed_symptom_qa(self):
         """Generate detailed Q&A about symptoms and when to seek care"""
-        symptom_data = []
-        
-        symptoms = [
+        symptoms = (
             'chest pain', 'shortness of breath', 'severe headache', 'high fever',
             'persistent cough', 'abdominal pain', 'dizziness', 'fatigue',
             'weight loss', 'nausea', 'back pain', 'joint pain', 'skin rash',
             'vision problems', 'hearing problems', 'memory issues', 'difficulty swallowing'
-        ]
-        
-        for symptom in symptoms:
-            for hospital_key, info in self.hospitals.items():
-                hospital_name = info['name']
-                
-                symptom_data.extend([
-                    {
-                        'question': f'I have {symptom}, should I go to {hospital_name}?',
-                        'answer': f'If you\'re experiencing {symptom}, especially if severe or persistent, you should seek medical attention at {hospital_name}. Call {info["phone_main"]} for guidance.',
-                        'category': 'symptom_assessment',
-                        'hospital': hospital_key
-                    },
-                    {
-                        'question': f'What causes {symptom}?',
-                        'answer': f'{symptom.title()} can have various causes. The medical professionals at {hospital_name} can properly evaluate your symptoms and determine the underlying cause.',
-                        'category': 'symptom_causes',
-                        'hospital': hospital_key
-                    },
-                    {
-                        'question': f'How is {symptom} treated at {hospital_name}?',
-                        'answer': f'Treatment for {symptom} at {hospital_name} depends on the underlying cause. Our doctors will conduct proper evaluation and recommend appropriate treatment.',
-                        'category': 'symptom_treatment',
-                        'hospital': hospital_key
-                    }
-                ])
-        
-        return symptom_data
+        )
+
+        return self.build_hospital_rows(symptoms, SYMPTOM_TEMPLATES)
 
     def generate_cost_coverage_variations(self):
         """Generate variations of cost and insurance coverage questions"""
-        cost_data = []
-        
-        services = [
+        services = (
             'consultation', 'surgery', 'laboratory tests', 'radiology', 'admission',
             'emergency care', 'maternity care', 'dental care', 'eye care', 'physiotherapy'
-        ]
-        
-        for service in services:
-            for hospital_key, info in self.hospitals.items():
-                hospital_name = info['name']
-                
-                cost_data.extend([
-                    {
-                        'question': f'How much does {service} cost at {hospital_name}?',
-                        'answer': f'The cost of {service} at {hospital_name} varies depending on the specific treatment needed. Contact {info["phone_main"]} for detailed pricing information.',
-                        'category': 'service_costs',
-                        'hospital': hospital_key
-                    },
-                    {
-                        'question': f'Does insurance cover {service} at {hospital_name}?',
-                        'answer': f'Insurance coverage for {service} at {hospital_name} depends on your specific insurance plan. Check with your insurance provider and our billing department.',
-                        'category': 'insurance_coverage',
-                        'hospital': hospital_key
-                    },
-                    {
-                        'question': f'Can I pay in installments for {service} at {hospital_name}?',
-                        'answer': f'{hospital_name} may offer payment plans for {service}. Speak with our billing department about available payment options and financial assistance.',
-                        'category': 'payment_plans',
-                        'hospital': hospital_key
-                    }
-                ])
-        
-        return cost_data
+        )
+
+        return self.build_hospital_rows(services, COST_SERVICE_TEMPLATES)
 
     def generate_location_directions_qa(self):
         """Generate detailed location and directions questions"""
         location_data = []
         
-        for hospital_key, info in self.hospitals.items():
+        for hospital_key, info in self.hospital_items:
             hospital_name = info['name']
+            phone = info['phone_main']
             
-            location_data.extend([
-                {
-                    'question': f'Where is {hospital_name} located?',
-                    'answer': f'{hospital_name} is located in Nairobi, Kenya. You can reach us by phone at {info["phone_main"]} for detailed directions to our facility.',
-                    'category': 'hospital_location',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'How do I get to {hospital_name}?',
-                    'answer': f'You can reach {hospital_name} in Nairobi by car, public transport, or taxi. Contact {info["phone_main"]} for specific directions and landmarks.',
-                    'category': 'directions',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Is {hospital_name} near public transport?',
-                    'answer': f'{hospital_name} is accessible by public transport in Nairobi. Various transport options including matatus and buses serve the area.',
-                    'category': 'public_transport',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'What landmarks are near {hospital_name}?',
-                    'answer': f'{hospital_name} is located in Nairobi with recognizable landmarks nearby. Staff can provide detailed landmark directions when you call {info["phone_main"]}.',
-                    'category': 'landmarks',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Is there taxi service to {hospital_name}?',
-                    'answer': f'Yes, taxi services including Uber and Bolt operate to {hospital_name} in Nairobi. Public transport options are also available.',
-                    'category': 'taxi_service',
-                    'hospital': hospital_key
-                }
-            ])
+            location_data.append({
+                'question': f'Where is {hospital_name} located?',
+                'answer': f'{hospital_name} is located in Nairobi, Kenya. You can reach us by phone at {phone} for detailed directions to our facility.',
+                'category': 'hospital_location',
+                'hospital': hospital_key
+            })
+            location_data.append({
+                'question': f'How do I get to {hospital_name}?',
+                'answer': f'You can reach {hospital_name} in Nairobi by car, public transport, or taxi. Contact {phone} for specific directions and landmarks.',
+                'category': 'directions',
+                'hospital': hospital_key
+            })
+            location_data.append({
+                'question': f'Is {hospital_name} near public transport?',
+                'answer': f'{hospital_name} is accessible by public transport in Nairobi. Various transport options including matatus and buses serve the area.',
+                'category': 'public_transport',
+                'hospital': hospital_key
+            })
+            location_data.append({
+                'question': f'What landmarks are near {hospital_name}?',
+                'answer': f'{hospital_name} is located in Nairobi with recognizable landmarks nearby. Staff can provide detailed landmark directions when you call {phone}.',
+                'category': 'landmarks',
+                'hospital': hospital_key
+            })
+            location_data.append({
+                'question': f'Is there taxi service to {hospital_name}?',
+                'answer': f'Yes, taxi services including Uber and Bolt operate to {hospital_name} in Nairobi. Public transport options are also available.',
+                'category': 'taxi_service',
+                'hospital': hospital_key
+            })
         
         return location_data
 
@@ -1192,41 +1241,39 @@ class HospitalDataGenerator:
         """Generate seasonal health and disease prevention Q&A"""
         seasonal_data = []
         
-        for hospital_key, info in self.hospitals.items():
+        for hospital_key, info in self.hospital_items:
             hospital_name = info['name']
             
-            seasonal_data.extend([
-                {
-                    'question': f'Does {hospital_name} offer flu vaccination?',
-                    'answer': f'Yes, {hospital_name} provides seasonal flu vaccination to help protect against influenza. Contact us during flu season for availability.',
-                    'category': 'seasonal_vaccination',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'How does {hospital_name} handle malaria cases?',
-                    'answer': f'{hospital_name} has experienced staff and proper medication for malaria diagnosis and treatment. We provide both prevention advice and treatment.',
-                    'category': 'malaria_care',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Does {hospital_name} treat typhoid?',
-                    'answer': f'Yes, {hospital_name} diagnoses and treats typhoid fever with appropriate antibiotics and supportive care from our qualified medical team.',
-                    'category': 'typhoid_treatment',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'What about cholera treatment at {hospital_name}?',
-                    'answer': f'{hospital_name} is equipped to handle cholera cases with proper isolation, rehydration therapy, and antibiotic treatment when necessary.',
-                    'category': 'cholera_treatment',
-                    'hospital': hospital_key
-                },
-                {
-                    'question': f'Does {hospital_name} offer travel medicine?',
-                    'answer': f'Yes, {hospital_name} provides travel medicine consultations including vaccinations and health advice for international travel.',
-                    'category': 'travel_medicine',
-                    'hospital': hospital_key
-                }
-            ])
+            seasonal_data.append({
+                'question': f'Does {hospital_name} offer flu vaccination?',
+                'answer': f'Yes, {hospital_name} provides seasonal flu vaccination to help protect against influenza. Contact us during flu season for availability.',
+                'category': 'seasonal_vaccination',
+                'hospital': hospital_key
+            })
+            seasonal_data.append({
+                'question': f'How does {hospital_name} handle malaria cases?',
+                'answer': f'{hospital_name} has experienced staff and proper medication for malaria diagnosis and treatment. We provide both prevention advice and treatment.',
+                'category': 'malaria_care',
+                'hospital': hospital_key
+            })
+            seasonal_data.append({
+                'question': f'Does {hospital_name} treat typhoid?',
+                'answer': f'Yes, {hospital_name} diagnoses and treats typhoid fever with appropriate antibiotics and supportive care from our qualified medical team.',
+                'category': 'typhoid_treatment',
+                'hospital': hospital_key
+            })
+            seasonal_data.append({
+                'question': f'What about cholera treatment at {hospital_name}?',
+                'answer': f'{hospital_name} is equipped to handle cholera cases with proper isolation, rehydration therapy, and antibiotic treatment when necessary.',
+                'category': 'cholera_treatment',
+                'hospital': hospital_key
+            })
+            seasonal_data.append({
+                'question': f'Does {hospital_name} offer travel medicine?',
+                'answer': f'Yes, {hospital_name} provides travel medicine consultations including vaccinations and health advice for international travel.',
+                'category': 'travel_medicine',
+                'hospital': hospital_key
+            })
         
         return seasonal_data
 
@@ -1241,30 +1288,33 @@ class HospitalDataGenerator:
         ]
         
         for age_key, age_desc in age_groups:
-            for hospital_key, info in self.hospitals.items():
+            # Intern the derived category names so every row for this age
+            # group shares one string object instead of a fresh f-string
+            care_category = sys.intern(f'{age_key}_care')
+            services_category = sys.intern(f'{age_key}_services')
+            for hospital_key, info in self.hospital_items:
                 hospital_name = info['name']
-                
-                age_data.extend([
-                    {
-                        'question': f'Does {hospital_name} treat {age_desc}?',
-                        'answer': f'Yes, {hospital_name} provides comprehensive medical care for {age_desc} with specialized services appropriate for their age group.',
-                        'category': f'{age_key}_care',
-                        'hospital': hospital_key
-                    },
-                    {
-                        'question': f'What services does {hospital_name} offer for {age_desc}?',
-                        'answer': f'{hospital_name} offers age-appropriate medical services for {age_desc} including preventive care, treatment, and specialized consultations.',
-                        'category': f'{age_key}_services',
-                        'hospital': hospital_key
-                    }
-                ])
+
+                age_data.append({
+                    'question': f'Does {hospital_name} treat {age_desc}?',
+                    'answer': f'Yes, {hospital_name} provides comprehensive medical care for {age_desc} with specialized services appropriate for their age group.',
+                    'category': care_category,
+                    'hospital': hospital_key
+                })
+                age_data.append({
+                    'question': f'What services does {hospital_name} offer for {age_desc}?',
+                    'answer': f'{hospital_name} offers age-appropriate medical services for {age_desc} including preventive care, treatment, and specialized consultations.',
+                    'category': services_category,
+                    'hospital': hospital_key
+                })
         
         return age_data
 
     def generate_alternative_phrasing_qa(self):
         """Generate alternative phrasings for common questions to improve NLP training"""
         alternative_data = []
-        
+        append = alternative_data.append
+
         # Alternative ways to ask about contact information
         contact_alternatives = [
             ('What\'s the phone number', 'phone number'),
@@ -1275,12 +1325,12 @@ class HospitalDataGenerator:
         ]
         
         for question_start, answer_type in contact_alternatives:
-            for hospital_key, info in self.hospitals.items():
+            for hospital_key, info in self.hospital_items:
                 hospital_name = info['name']
-                
-                alternative_data.append({
+
+                append({
                     'question': f'{question_start} for {hospital_name}?',
-                    'answer': f'You can reach {hospital_name} at {info["phone_main"]}. For emergencies, call {info["phone_emergency"]}.',
+                    'answer': self.contact_answers[hospital_key],
                     'category': 'contact_alternatives',
                     'hospital': hospital_key
                 })
@@ -1296,12 +1346,13 @@ class HospitalDataGenerator:
         ]
         
         for question in appointment_alternatives:
-            for hospital_key, info in self.hospitals.items():
+            for hospital_key, info in self.hospital_items:
                 hospital_name = info['name']
+                phone = info['phone_main']
                 
-                alternative_data.append({
+                append({
                     'question': f'{question} at {hospital_name}?',
-                    'answer': f'To book an appointment at {hospital_name}, call {info["phone_main"]} or visit the hospital during working hours. Online booking may also be available.',
+                    'answer': f'To book an appointment at {hospital_name}, call {phone} or visit the hospital during working hours. Online booking may also be available.',
                     'category': 'appointment_alternatives',
                     'hospital': hospital_key
                 })
@@ -1316,10 +1367,10 @@ class HospitalDataGenerator:
         ]
         
         for question in service_alternatives:
-            for hospital_key, info in self.hospitals.items():
+            for hospital_key, info in self.hospital_items:
                 hospital_name = info['name']
                 
-                alternative_data.append({
+                append({
                     'question': f'{question} at {hospital_name}?',
                     'answer': f'{hospital_name} offers comprehensive medical services including consultations, diagnostics, surgery, emergency care, and specialized treatments across multiple departments.',
                     'category': 'service_alternatives',
@@ -1332,19 +1383,17 @@ class HospitalDataGenerator:
         """Save data in multiple formats"""
         os.makedirs('data', exist_ok=True)
         
-        # Save as CSV
+        # Save as CSV, serializing the rows once; the second file is a
+        # byte-for-byte copy, so quoting/escaping is not redone per row
         csv_file = 'data/hospital_comprehensive_data.csv'
         with open(csv_file, 'w', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=['question', 'answer', 'category', 'hospital'])
             writer.writeheader()
             writer.writerows(data)
-        
+
         # Replace the main hospital data file
         csv_file2 = 'data/hospital_kenya_10k.csv'
-        with open(csv_file2, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=['question', 'answer', 'category', 'hospital'])
-            writer.writeheader()
-            writer.writerows(data)
+        shutil.copyfile(csv_file, csv_file2)
         
         # Save as JSON with metadata
         json_file = 'data/hospital_data_complete.json'
@@ -1353,19 +1402,38 @@ class HospitalDataGenerator:
                 'generated_at': datetime.now().isoformat(),
                 'total_records': len(data),
                 'hospitals': ['nairobi_hospital', 'kenyatta_national'],
-                'categories': list(set(item['category'] for item in data)),
+                'categories': sorted(self._categories or {item['category'] for item in data}),
                 'version': '2.0'
             },
             'data': data
         }
         
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
-        
+        if ORJSON_AVAILABLE:
+            with open(json_file, 'wb') as f:
+                f.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_file, 'w', encoding='utf-8') as f:
+                json.dump(json_data, f, indent=2, ensure_ascii=False)
+
+        # Save as zstd-compressed Parquet when pyarrow is installed:
+        # much smaller than CSV and directly loadable by columnar tools
+        parquet_file = None
+        if PARQUET_AVAILABLE:
+            parquet_file = 'data/hospital_comprehensive_data.parquet'
+            table = pa.table({
+                'question': [row['question'] for row in data],
+                'answer': [row['answer'] for row in data],
+                'category': [row['category'] for row in data],
+                'hospital': [row['hospital'] for row in data]
+            })
+            pq.write_table(table, parquet_file, compression='zstd')
+
         print(f"Saved to:")
         print(f"   {csv_file}")
         print(f"   {csv_file2}")
         print(f"   {json_file}")
+        if parquet_file:
+            print(f"   {parquet_file}")
 
 def main():
     """Main function"""
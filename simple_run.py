@@ -16,11 +16,40 @@ Author: AI Term Project G3
 
 import sys
 import os
+import json
+import random
 import time
 import subprocess
-import requests
 from pathlib import Path
 
+# Backend endpoints, built once instead of per health check
+BACKEND_URL = "http://localhost:5000"
+HEALTH_URL = BACKEND_URL + "/health"
+
+# Shared HTTP session so repeated health checks reuse one pooled connection
+_http_session = None
+
+def get_http_session():
+    """Return a shared requests.Session with connection pooling and retries"""
+    global _http_session
+    if _http_session is None:
+        # Deferred import: requests pulls in urllib3/idna/ssl, which is
+        # wasted startup time for modes that never touch the network
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"Connection": "keep-alive"})
+        _http_session = session
+    return _http_session
+
 def print_banner():
     """Print startup banner"""
     print("\n" + "="*60)
@@ -34,9 +63,11 @@ def print_banner():
 def check_backend_health(show_error=True):
     """Check if backend is running"""
     try:
-        response = requests.get("http://localhost:5000/health", timeout=5)
+        response = get_http_session().get(HEALTH_URL, timeout=(2, 5))
         if response.status_code == 200:
-            data = response.json()
+            # Parse the raw bytes directly; .json() adds content-type
+            # sniffing and encoding detection the tiny payload never needs
+            data = json.loads(response.content)
             qa_pairs = data.get('qa_pairs_loaded', 0)
             model_type = data.get('model_type', 'Unknown')
             print(f"[OK] Backend healthy! {qa_pairs} Q&A pairs loaded, Model: {model_type}")
@@ -62,14 +93,20 @@ def start_backend():
         
         print(f"[OK] Backend server started (PID: {process.pid})")
         
-        # Wait for backend to be ready (AI models take time to load)
+        # Wait for backend to be ready (AI models take time to load).
+        # Poll with exponential backoff plus jitter instead of a fixed
+        # interval so a slow-starting backend is not hammered with probes.
         print("Waiting for backend to be ready...")
-        for i in range(30):  # Wait up to 30 seconds for AI models
-            time.sleep(2)
-            if check_backend_health(show_error=(i > 10)):
+        delay = 0.5
+        waited = 0.0
+        while waited < 60:  # Wait up to a minute for AI models
+            time.sleep(delay)
+            waited += delay
+            if check_backend_health(show_error=(waited > 20)):
                 break
-            if i % 5 == 0:
-                print(f"[INFO] Still waiting for AI models to load... ({i*2}s)")
+            if waited > 10:
+                print(f"[INFO] Still waiting for AI models to load... ({int(waited)}s)")
+            delay = min(8, delay * 2) + random.random() * 0.2
         else:
             print("[WARNING] Backend may still be loading AI models")
             print("[INFO] This is normal for first startup - models need to download")